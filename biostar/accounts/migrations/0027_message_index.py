@@ -0,0 +1,19 @@
+# Generated by Django 3.2 on 2026-10-15 09:11
+
+from django.conf import settings
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('accounts', '0026_userlog'),
+    ]
+
+    operations = [
+        migrations.AlterIndexTogether(
+            name='message',
+            index_together={('recipient', 'unread', 'sent_date')},
+        ),
+    ]
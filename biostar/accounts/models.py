@@ -6,7 +6,6 @@ from django.contrib.auth.models import User
 from django.db import models
 from django.shortcuts import reverse
 from taggit.managers import TaggableManager
-from taggit.models import Tag
 
 from biostar.accounts import util
 
@@ -200,9 +199,7 @@ class Profile(models.Model):
         return [tag.lower() for tag in self.watched_tags.split(",") if tag]
 
     def add_watched(self):
-        tags = [Tag.objects.get_or_create(name=name)[0] for name in self.parse_tags()]
-        self.watched.clear()
-        self.watched.add(*tags)
+        self.watched.set(*self.parse_tags())
 
     def set_upload_size(self):
         """
@@ -398,6 +395,10 @@ class Message(models.Model):
     unread = models.BooleanField(default=True)
     sent_date = models.DateTimeField(db_index=True, null=True)
 
+    class Meta:
+        # Unread counts and the inbox look up the messages of a recipient.
+        index_together = (("recipient", "unread", "sent_date"),)
+
     def save(self, *args, **kwargs):
         self.sent_date = self.sent_date or util.now()
         super(Message, self).save(**kwargs)
@@ -23,7 +23,7 @@ def create_profile(sender, instance, created, raw, using, **kwargs):
         username = f"{instance.pk}"
 
         # Fix uid clashes.
-        if Profile.objects.filter(uid=username):
+        if Profile.objects.filter(uid=username).exists():
             username = util.get_uuid(8)
             logger.info(f"username clash for pk={instance.pk} new uid={username}")
 
@@ -95,8 +95,10 @@ def create_messages(template, user_ids, sender=None, extra_context={}):
     Create batch message from sender to a given recipient_list
     """
     from biostar.accounts.models import User, Message, MessageBody
+    from biostar.accounts import util
 
-    rec_list = User.objects.filter(id__in=user_ids)
+    # Only the ids of the existing recipients are needed.
+    rec_ids = User.objects.filter(id__in=user_ids).values_list("id", flat=True)
     # Get the sender
     name, email = settings.ADMINS[0]
     sender = sender or User.objects.filter(email=email).first() or User.objects.filter(is_superuser=True).first()
@@ -111,5 +113,8 @@ def create_messages(template, user_ids, sender=None, extra_context={}):
     html = mistune.markdown(body, escape=False)
     body = MessageBody.objects.create(body=body, html=html)
 
-    for rec in rec_list:
-        Message.objects.create(sender=sender, recipient=rec, body=body)
+    # Bulk creation bypasses Message.save(), set the date here.
+    sent_date = util.now()
+    msgs = [Message(sender=sender, recipient_id=rec_id, body=body, sent_date=sent_date) for rec_id in rec_ids]
+
+    Message.objects.bulk_create(msgs, batch_size=500)
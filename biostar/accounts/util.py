@@ -1,4 +1,4 @@
-import uuid
+import secrets
 from datetime import datetime
 from django.utils import timezone
 from django.utils.timezone import utc
@@ -6,7 +6,7 @@ from django.conf import settings
 
 
 def get_uuid(limit=32):
-    return str(uuid.uuid4())[:limit]
+    return secrets.token_hex((limit + 1) // 2)[:limit]
 
 
 def now():
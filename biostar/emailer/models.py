@@ -1,4 +1,4 @@
-import uuid
+import secrets
 
 from django.db import models
 
@@ -9,7 +9,7 @@ MAX_TEMPLATE_LEN = 20 * MAX_TEXT_LEN
 
 
 def get_uuid(limit=32):
-    return str(uuid.uuid4())[:limit]
+    return secrets.token_hex((limit + 1) // 2)[:limit]
 
 
 class EmailAddress(models.Model):
@@ -5,6 +5,7 @@ import logging
 from os.path import join, normpath
 from django.core.cache import cache
 from django.conf import settings
+from django.db.models import Count, Q
 from datetime import datetime, timedelta
 
 from django.http import HttpResponse
@@ -320,26 +321,22 @@ def tags_list(request):
     delta = util.now() - timedelta(weeks=weeks)
     query = Post.objects.filter(lastedit_date__gt=delta)
 
-    # Iterate over tags and collect counts.
+    # Collect the tag names from the file.
     lines = tags.readlines() if tags else []
+    names = {line.decode().lower().strip() for line in lines}
+    names.discard('')
 
-    data = {}
+    # Tags without any posts are reported with zero counts.
+    data = {name: dict(total=0, answer_count=0, comment_count=0) for name in names}
 
-    for line in lines:
-        tag = line.decode().lower().strip()
-        if not tag:
-            continue
+    # Count the posts of all tags in a single grouped query.
+    posts = query.filter(tags__name__in=names, is_toplevel=True).order_by()
+    counts = posts.values('tags__name').annotate(n_total=Count('id'),
+                                                 n_answered=Count('id', filter=Q(answer_count__gte=1)),
+                                                 n_commented=Count('id', filter=Q(comment_count__gte=1)))
 
-        # Get posts with this tag, that have been answered
-        posts = query.filter(tags__name=tag.lower(), is_toplevel=True)
-        uids = posts.values_list('uid', flat=True)
-
-        # Filter so the count is only 1 answer per questions
-        answer_count = Post.objects.filter(uid__in=uids, answer_count__gte=1).count()
-        comment_count = Post.objects.filter(uid__in=uids, comment_count__gte=1).count()
-        total = len(uids)
-
-        val = dict(total=total, answer_count=answer_count, comment_count=comment_count)
-        data.setdefault(tag, {}).update(val)
+    for row in counts:
+        val = dict(total=row['n_total'], answer_count=row['n_answered'], comment_count=row['n_commented'])
+        data[row['tags__name']].update(val)
 
     return data
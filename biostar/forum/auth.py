@@ -36,7 +36,7 @@ def get_votes(user, root):
 
     # Collect all the votes for the user.
     if user.is_authenticated:
-        votes = Vote.objects.filter(post__root=root, author=user).values_list("type", "post__id")
+        votes = Vote.objects.filter(post__root=root, author=user).values_list("type", "post_id")
 
         for vote_type, post_id, in votes:
             store.setdefault(vote_type, set()).add(post_id)
@@ -139,10 +139,12 @@ def gravatar(user, size=80):
     return gravatar_url(email=email, style=style, size=size)
 
 
-def walk_down_thread(parent, collect=set()):
+def walk_down_thread(parent, collect=None):
     """
     Recursively walk down a thread of posts starting from target
     """
+    # A default set would be shared between calls.
+    collect = set() if collect is None else collect
 
     # Stop condition: post does not have a root or parent.
     if (parent is None) or (parent.parent is None) or (parent.root is None):
@@ -293,6 +295,9 @@ def post_tree(user, root):
     # Build comments tree.
     comment_tree = dict()
 
+    # Moderation rights are the same for every post in the thread.
+    is_moderator = user.is_authenticated and user.profile.is_moderator
+
     def decorate(post):
         # Mutates the elements! Not worth creating copies.
         if post.is_comment:
@@ -300,9 +305,9 @@ def post_tree(user, root):
         post.has_bookmark = int(post.id in bookmarks)
         post.has_upvote = int(post.id in upvotes)
         if user.is_authenticated:
-            post.can_accept = not post.is_toplevel and (user == post.root.author or user.profile.is_moderator)
-            post.can_moderate = user.profile.is_moderator
-            post.is_editable = (user == post.author or user.profile.is_moderator)
+            post.can_accept = not post.is_toplevel and (user.id == post.root.author_id or is_moderator)
+            post.can_moderate = is_moderator
+            post.is_editable = (user.id == post.author_id or is_moderator)
         else:
             post.can_accept = False
             post.is_editable = False
@@ -328,16 +333,21 @@ def valid_awards(user):
     """
 
     valid = []
+
+    # Load all badges at once, keyed by name (the first badge wins on duplicate names).
+    badges = {badge.name: badge for badge in Badge.objects.order_by("-pk")}
+
     # Randomly go from one badge to the other
     for award in awards.ALL_AWARDS:
 
         # Valid award targets the user has earned
         targets = award.get_awards(user)
 
+        badge = badges.get(award.name)
+
         for target in targets:
             post = target if isinstance(target, Post) else None
             date = post.lastedit_date if post else user.profile.last_login
-            badge = Badge.objects.filter(name=award.name).first()
 
             valid.append((user, badge, date, post))
 
@@ -368,51 +378,85 @@ def get_counts(user):
     return counts
 
 
-@transaction.atomic
+def toggle_vote(post, user, vote_type):
+    """
+    Removes an existing vote or adds a new one, returns the vote and the change.
+    """
+    # Remove an existing vote with a single delete query.
+    deleted, _ = Vote.objects.filter(author=user, post=post, type=vote_type).delete()
+
+    if deleted:
+        return None, -1
+
+    vote = Vote.objects.create(author=user, post=post, type=vote_type)
+    return vote, +1
+
+
 def apply_vote(post, user, vote_type):
-    vote = Vote.objects.filter(author=user, post=post, type=vote_type).first()
 
-    if vote:
-        msg = f"{vote.get_type_display()} removed"
-        change = -1
-        vote.delete()
+    own_post = (post.author_id == user.id)
+
+    if own_post:
+        # Author making the change, no counts depend on it.
+        # The insert only runs when the delete removed nothing, so at most one row changes.
+        vote, change = toggle_vote(post=post, user=user, vote_type=vote_type)
     else:
-        change = +1
-        vote = Vote.objects.create(author=user, post=post, type=vote_type)
-        msg = f"{vote.get_type_display()} added"
+        # The vote and the counts it affects are written together.
+        with transaction.atomic():
+            vote, change = toggle_vote(post=post, user=user, vote_type=vote_type)
+            update_vote_counts(post=post, vote_type=vote_type, change=change)
+
+    label = dict(Vote.TYPE_CHOICES).get(vote_type)
+    msg = f"{label} removed" if change < 0 else f"{label} added"
 
-    if post.author == user:
-        # Author making the change
-        change = 0
-        return msg, vote, change
+    if own_post:
+        # Votes on own posts do not change any counts.
+        return msg, vote, 0
 
+    # Reset bookmark cache
+    if vote_type == Vote.BOOKMARK:
+        delete_cache(BOOKMARKS, user)
+
+    return msg, vote, change
+
+
+def update_vote_counts(post, vote_type, change):
+    """
+    Updates the author score and the post counts after a vote changes.
+    """
     # Fetch update the user score.
-    Profile.objects.filter(user=post.author).update(score=F('score') + change)
+    Profile.objects.filter(user_id=post.author_id).update(score=F('score') + change)
 
-    # Calculate counts for the current post
-    votes = list(Vote.objects.filter(post=post).exclude(author=post.author))
-    vote_count = len(votes)
-    bookcount = len(list(filter(lambda v: v.type == Vote.BOOKMARK, votes)))
-    accept_count = len(list(filter(lambda v: v.type == Vote.ACCEPT, votes)))
+    # Calculate counts for the current post, only the vote types are needed.
+    vote_types = list(Vote.objects.filter(post=post).exclude(author_id=post.author_id).values_list("type", flat=True))
+    vote_count = len(vote_types)
+    bookcount = vote_types.count(Vote.BOOKMARK)
+    accept_count = vote_types.count(Vote.ACCEPT)
 
     # Increment the post vote count.
-    Post.objects.filter(uid=post.uid).update(vote_count=vote_count)
+    post_changes = dict(vote_count=vote_count)
 
     # The thread vote count represents all votes in a thread
-    Post.objects.filter(uid=post.root.uid).update(thread_votecount=F('thread_votecount') + change)
+    root_changes = dict(thread_votecount=F('thread_votecount') + change)
 
     # Increment the bookmark count.
     if vote_type == Vote.BOOKMARK:
-        Post.objects.filter(uid=post.uid).update(book_count=bookcount)
-        # Reset bookmark cache
-        delete_cache(BOOKMARKS, user)
+        post_changes.update(book_count=bookcount)
 
     # Handle accepted vote.
     if vote_type == Vote.ACCEPT:
-        Post.objects.filter(uid=post.uid).update(accept_count=accept_count)
-        Post.objects.filter(uid=post.root.uid).update(accept_count=F('accept_count') + change)
-
-    return msg, vote, change
+        post_changes.update(accept_count=accept_count)
+        root_changes.update(accept_count=F('accept_count') + change)
+
+    if post.pk == post.root_id:
+        # A vote on the root writes a single row.
+        # The root keeps the thread total of accepted posts, the increment replaces the count of its own votes.
+        post_changes.update(root_changes)
+        Post.objects.filter(pk=post.pk).update(**post_changes)
+    else:
+        # Only the changed columns are written, one update for the post and one for the root.
+        Post.objects.filter(pk=post.pk).update(**post_changes)
+        Post.objects.filter(pk=post.root_id).update(**root_changes)
 
 
 def move(request, parent, source, ptype=Post.COMMENT, msg="moved"):
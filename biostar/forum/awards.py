@@ -118,7 +118,7 @@ COMMENTATOR = AwardDef(
 CENTURION = AwardDef(
     name="Centurion",
     desc="created 100 posts",
-    func=lambda user: wrap_qs(Post.objects.filter(author=user).count() > 100, User, user.id),
+    func=lambda user: wrap_qs(Post.objects.filter(author=user)[:101].count() > 100, User, user.id),
     max=1,
     icon="bolt icon",
     type=Badge.SILVER,
@@ -145,7 +145,7 @@ POPULAR = AwardDef(
 ORACLE = AwardDef(
     name="Oracle",
     desc="created more than 1,000 posts (questions + answers + comments)",
-    func=lambda user: wrap_qs(Post.objects.filter(author=user).count() > 1000, User, user.id),
+    func=lambda user: wrap_qs(Post.objects.filter(author=user)[:1001].count() > 1000, User, user.id),
     max=1,
     icon="sun icon",
     type=Badge.GOLD,
@@ -163,7 +163,7 @@ PUNDIT = AwardDef(
 GURU = AwardDef(
     name="Guru",
     desc="received more than 100 upvotes",
-    func=lambda user: wrap_qs(Vote.objects.filter(post__author=user).count() > 100, User, user.id),
+    func=lambda user: wrap_qs(Vote.objects.filter(post__author=user)[:101].count() > 100, User, user.id),
     max=1,
     icon="beer icon",
     type=Badge.SILVER,
@@ -172,7 +172,7 @@ GURU = AwardDef(
 CYLON = AwardDef(
     name="Cylon",
     desc="received 1,000 up votes",
-    func=lambda user: wrap_qs(Vote.objects.filter(post__author=user).count() > 1000, User, user.id),
+    func=lambda user: wrap_qs(Vote.objects.filter(post__author=user)[:1001].count() > 1000, User, user.id),
     max=1,
     icon="rocket icon",
     type=Badge.GOLD,
@@ -181,7 +181,7 @@ CYLON = AwardDef(
 VOTER = AwardDef(
     name="Voter",
     desc="voted more than 100 times",
-    func=lambda user: wrap_qs(Vote.objects.filter(author=user).count() > 100, User, user.id),
+    func=lambda user: wrap_qs(Vote.objects.filter(author=user)[:101].count() > 100, User, user.id),
     max=1,
     icon="thumbs up outline icon"
 )
@@ -189,7 +189,7 @@ VOTER = AwardDef(
 SUPPORTER = AwardDef(
     name="Supporter",
     desc="voted at least 25 times",
-    func=lambda user: wrap_qs(Vote.objects.filter(author=user).count() > 25, User, user.id),
+    func=lambda user: wrap_qs(Vote.objects.filter(author=user)[:26].count() > 25, User, user.id),
     max=1,
     icon="thumbs up icon",
     type=Badge.SILVER,
@@ -223,7 +223,7 @@ LIBRARIAN = AwardDef(
 def rising_star(user):
     # The user joined no more than three months ago
     cond = now() < user.profile.date_joined + timedelta(weeks=15)
-    cond = cond and Post.objects.filter(author=user).count() > 50
+    cond = cond and Post.objects.filter(author=user)[:51].count() > 50
     return wrap_qs(cond, User, user.id)
 
 
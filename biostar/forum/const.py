@@ -35,6 +35,20 @@ USERS_LIST_KEY = "USERS_LIST"
 COUNT_DATA_KEY = "COUNT_DATA"
 VOTES_COUNT = 'vote_count'
 
+# Wide text columns that post lists do not render.
+LIST_DEFERRED = [
+    "content", "html", "root__content", "root__html",
+    "author__profile__text", "author__profile__html", "author__profile__my_tags", "author__profile__watched_tags",
+    "lastedit_user__profile__text", "lastedit_user__profile__html", "lastedit_user__profile__my_tags",
+    "lastedit_user__profile__watched_tags",
+]
+
+# Wide text columns of the voted posts that vote lists do not render.
+VOTE_LIST_DEFERRED = [
+    "post__content", "post__html", "post__root__content", "post__root__html",
+    "author__profile__text", "author__profile__html", "author__profile__my_tags", "author__profile__watched_tags",
+]
+
 # Tabs to pick from in post listing
 MYVOTES, MYPOSTS, MYTAGS, OPEN, \
 FOLLOWING, SHOW_SPAM, BOOKMARKS = ["myvotes", "myposts", "mytags", "open", "following", "spam", "bookmarks"]
@@ -24,6 +24,9 @@ MIN_CONTENT = 5
 MAX_TITLE = 400
 MAX_TAGS = 5
 
+# Valid characters in a tag when strict tags are enforced.
+TAG_PATTERN = re.compile(r'^[A-Za-z0-9-._]+$')
+
 
 def valid_language(text):
     supported_languages = settings.LANGUAGE_DETECTION
@@ -159,12 +162,11 @@ class PostLongForm(forms.Form):
         Take out duplicates
         """
         if settings.STRICT_TAGS:
-            pattern = r'^[A-Za-z0-9-._]+$'
             tag_val = self.cleaned_data["tag_val"]
             tag_val = tag_val.replace(',', ' ').split()
 
             for tag in tag_val:
-                match = re.match(pattern, tag)
+                match = TAG_PATTERN.match(tag)
                 if not match:
                     raise forms.ValidationError(f'Invalid characters in tag: {tag}')
         else:
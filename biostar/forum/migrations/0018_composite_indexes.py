@@ -0,0 +1,23 @@
+# Generated by Django 3.2 on 2026-10-15 09:11
+
+from django.conf import settings
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('forum', '0017_expanded_log'),
+    ]
+
+    operations = [
+        migrations.AlterIndexTogether(
+            name='post',
+            index_together={('root', 'type'), ('parent', 'type')},
+        ),
+        migrations.AlterIndexTogether(
+            name='vote',
+            index_together={('post', 'author', 'type')},
+        ),
+    ]
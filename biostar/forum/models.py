@@ -6,7 +6,7 @@ from django.contrib.sites.models import Site
 from django.core.cache import cache
 from django.core.cache.utils import make_template_fragment_key
 from django.db import models
-from django.db.models import F
+from django.db.models import Count, F
 from django.db.models import Q
 from django.shortcuts import reverse
 from taggit.managers import TaggableManager
@@ -58,6 +58,21 @@ class PostManager(models.Manager):
         return query
 
 
+class RootPostManager(models.Manager):
+
+    def get_queryset(self):
+        """
+        Returns posts with the root and the author information needed to render a thread.
+        """
+        query = super().get_queryset()
+
+        # Only the root is rendered, the post view redirects any other post to its root.
+        # Reverse relations (children, descendants) cannot be joined, the thread is fetched separately.
+        query = query.select_related("root", "root__author__profile", "root__lastedit_user__profile")
+
+        return query
+
+
 def delete_fragment_cache(key, *params):
     """
     Drops a template fragment cache.
@@ -198,6 +213,29 @@ class Post(models.Model):
 
     objects = PostManager()
 
+    # Used when rendering a thread starting from its root.
+    tree_posts = RootPostManager()
+
+    class Meta:
+        # Thread and reply counts filter on the root or the parent together with the type.
+        index_together = (("root", "type"), ("parent", "type"))
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super(Post, cls).from_db(db, field_names, values)
+
+        # Remember what the stored html was rendered from.
+        if 'content' in field_names and 'parent_id' in field_names:
+            instance._rendered = instance.render_key()
+
+        return instance
+
+    def render_key(self):
+        """
+        The values the html depends on, the parent resolves the root for mentions.
+        """
+        return self.content, self.parent_id
+
     def parse_tags(self):
         return [tag.lower() for tag in self.tag_val.split(",") if tag]
 
@@ -225,12 +263,12 @@ class Post(models.Model):
     def recompute_scores(self):
         # Recompute answers count
         if self.type == Post.ANSWER:
-            answer_count = Post.objects.valid_posts(root=self.root, type=Post.ANSWER).count()
+            answer_count = Post.objects.valid_posts(root_id=self.root_id, type=Post.ANSWER).count()
             Post.objects.filter(pk=self.parent_id).update(answer_count=answer_count)
 
-        reply_count = Post.objects.valid_posts(root=self.root).exclude(pk=self.root.pk).count()
+        reply_count = Post.objects.valid_posts(root_id=self.root_id).exclude(pk=self.root_id).count()
 
-        Post.objects.filter(pk=self.root.id).update(reply_count=reply_count)
+        Post.objects.filter(pk=self.root_id).update(reply_count=reply_count)
 
     def json_data(self):
         data = {
@@ -256,7 +294,7 @@ class Post(models.Model):
             'subs_count': self.subs_count,
             'answer_count': self.root.reply_count,
             'has_accepted': self.has_accepted,
-            'parent_id': self.parent.id,
+            'parent_id': self.parent_id,
             'root_id': self.root_id,
             'xhtml': self.html,
             'content': self.content,
@@ -321,8 +359,10 @@ class Post(models.Model):
         self.creation_date = self.creation_date or util.now()
         self.lastedit_date = self.lastedit_date or util.now()
 
-        # Sanitize the post body.
-        self.html = markdown.parse(self.content, post=self, clean=True, escape=False)
+        # Sanitize the post body, only when the content changed since it was last rendered.
+        if not self.html or getattr(self, '_rendered', None) != self.render_key():
+            self.html = markdown.parse(self.content, post=self, clean=True, escape=False)
+            self._rendered = self.render_key()
         self.tag_val = self.tag_val.replace(' ', '')
         # Default tags
         self.tag_val = self.tag_val or "tag1,tag2"
@@ -341,23 +381,25 @@ class Post(models.Model):
     def update_parent_counts(self):
         """
         Update the counts for the parent and root
+        Only the foreign key ids are used, the parent and root are not fetched.
         """
 
-        descendants = Post.objects.filter(root=self.root).exclude(Q(pk=self.root.pk) | Q(status=Post.DELETED)
-                                                                  | Q(spam=Post.SPAM))
-        answer_count = descendants.filter(type=Post.ANSWER).count()
-        comment_count = descendants.filter(type=Post.COMMENT).count()
-        reply_count = descendants.count()
+        descendants = Post.objects.filter(root_id=self.root_id).exclude(Q(pk=self.root_id) | Q(status=Post.DELETED)
+                                                                        | Q(spam=Post.SPAM))
+        # Compute all thread counts in a single query.
+        counts = descendants.aggregate(answer_count=Count('id', filter=Q(type=Post.ANSWER)),
+                                       comment_count=Count('id', filter=Q(type=Post.COMMENT)),
+                                       reply_count=Count('id'))
+
         # Update the root reply, answer, and comment counts.
-        Post.objects.filter(pk=self.root.pk).update(reply_count=reply_count, answer_count=answer_count,
-                                                    comment_count=comment_count)
+        Post.objects.filter(pk=self.root_id).update(**counts)
 
-        children = Post.objects.filter(parent=self.parent).exclude(pk=self.parent.pk)
-        com_count = children.filter(type=Post.COMMENT).count()
+        children = Post.objects.filter(parent_id=self.parent_id).exclude(pk=self.parent_id)
+        counts = children.aggregate(comment_count=Count('id', filter=Q(type=Post.COMMENT)),
+                                    reply_count=Count('id'))
 
         # Update parent reply, answer, and comment counts.
-        Post.objects.filter(pk=self.parent.pk, is_toplevel=False).update(comment_count=com_count, answer_count=0,
-                                                                         reply_count=children.count())
+        Post.objects.filter(pk=self.parent_id, is_toplevel=False).update(answer_count=0, **counts)
 
     @property
     def css(self):
@@ -396,6 +438,10 @@ class Vote(models.Model):
     type = models.IntegerField(choices=TYPE_CHOICES, default=EMPTY, db_index=True)
     date = models.DateTimeField(db_index=True)
 
+    class Meta:
+        # Votes are toggled by post, author and type.
+        index_together = (("post", "author", "type"),)
+
     def __str__(self):
         return u"Vote: %s, %s, %s" % (self.post_id, self.author_id, self.get_type_display())
 
@@ -429,8 +475,9 @@ def update_post_views(post, request, timeout=settings.POST_VIEW_TIMEOUT):
     # Keys go by IP and post ip.
     cache_key = f"{ip}-{post.id}"
 
+    # Set the cache only when the key is missing.
     # Found hit no need to increment the views
-    if cache.get(cache_key):
+    if not cache.add(cache_key, 1, timeout):
         return
 
     # Insert a new view into database.
@@ -439,9 +486,6 @@ def update_post_views(post, request, timeout=settings.POST_VIEW_TIMEOUT):
     # Separately increment post view.
     Post.objects.filter(id=post.id).update(view_count=F('view_count') + 1)
 
-    # Set the cache.
-    cache.set(cache_key, 1, timeout)
-
     # Drop the post related cache for logged in users.
     if request.user.is_authenticated:
         delete_post_cache(post)
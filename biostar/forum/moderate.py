@@ -147,7 +147,7 @@ def removal_condition(post, user, age=1):
         return False
 
     # If the post has children it may not be removed
-    if Post.objects.filter(parent=post).exclude(pk=post.id):
+    if Post.objects.filter(parent=post).exclude(pk=post.id).exists():
         return False
 
     # If the post has votes it may not be removed
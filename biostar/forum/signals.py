@@ -1,7 +1,6 @@
 import logging
 from django.db.models.signals import post_save
 from django.dispatch import receiver
-from taggit.models import Tag
 from django.db.models import F, Q
 from biostar.accounts.models import Profile, Message, User
 from biostar.forum.models import Post, Award, Subscription
@@ -120,22 +119,23 @@ def finalize_post(sender, instance, created, **kwargs):
         tasks.mailing_list.spool(uid=instance.uid, extra_context=extra_context)
 
     # Set the tags on the instance.
+    # Existing tags are looked up in one query, only the changed tags are added or removed.
     if instance.is_toplevel:
-        tags = [Tag.objects.get_or_create(name=name)[0] for name in instance.parse_tags()]
-        instance.tags.clear()
-        instance.tags.add(*tags)
+        instance.tags.set(*instance.parse_tags())
+
+    # Ensure posts get re-indexed after being edited.
+    changes = dict(indexed=False)
 
     # Ensure spam posts get closed status
     if instance.is_spam:
-        Post.objects.filter(uid=instance.uid).update(status=Post.CLOSED)
+        changes.update(status=Post.CLOSED)
 
     if not instance.is_toplevel:
         # Title is inherited from top level.
-        title = f"{instance.get_type_display()}: {instance.root.title[:80]}"
-        Post.objects.filter(uid=instance.uid).update(title=title)
+        changes.update(title=f"{instance.get_type_display()}: {instance.root.title[:80]}")
 
-    # Ensure posts get re-indexed after being edited.
-    Post.objects.filter(uid=instance.uid).update(indexed=False)
+    # Apply all the column changes in a single update.
+    Post.objects.filter(uid=instance.uid).update(**changes)
 
     # Exclude current authors from receiving messages from themselves
     subs = subs.exclude(Q(type=Subscription.NO_MESSAGES) | Q(user=instance.author))
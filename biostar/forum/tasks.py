@@ -34,11 +34,13 @@ def notify_watched_tags(uid, extra_context):
     # Update template context with post
     extra_context.update(dict(post=post))
 
-    users = [User.objects.filter(profile__watched__name__iexact=tag.name).distinct()
-             for tag in post.root.tags.all()]
+    # Match any of the post tags, case insensitive.
+    cond = Q()
+    for name in post.root.tags.names():
+        cond |= Q(profile__watched__name__iexact=name)
 
-    # Flatten nested users queryset and get email.
-    emails = set(u.email for o in users for u in o)
+    # Collect the emails of the watching users in a single query.
+    emails = set(User.objects.filter(cond).values_list("email", flat=True)) if cond else set()
 
     from_email = settings.DEFAULT_NOREPLY_EMAIL
     if emails:
@@ -259,9 +261,8 @@ def mailing_list(uid, extra_context={}):
 
     # Get the post and users that have this enabled.
     post = Post.objects.filter(uid=uid).first()
-    users = User.objects.filter(profile__digest_prefs=Profile.ALL_MESSAGES)
-
-    emails = [user.email for user in users]
+    emails = User.objects.filter(profile__digest_prefs=Profile.ALL_MESSAGES).values_list("email", flat=True)
+    emails = list(emails)
 
     # Update template context with post
     extra_context.update(dict(post=post))
@@ -303,8 +304,8 @@ def notify_followers(sub_ids, author_id, uid, extra_context={}):
     author = User.objects.filter(id=author_id).first()
     subs = Subscription.objects.filter(id__in=sub_ids)
 
-    users = [sub.user for sub in subs]
-    user_ids = [u.pk for u in users]
+    # Only the user ids are needed, avoids fetching each user.
+    user_ids = list(subs.values_list("user_id", flat=True))
 
     # Update template context with post
     extra_context.update(dict(post=post))
@@ -319,11 +320,12 @@ def notify_followers(sub_ids, author_id, uid, extra_context={}):
     email_subs = subs.filter(type=Subscription.EMAIL_MESSAGE)
     # Exclude mailing list users to avoid duplicate emails.
     email_subs = email_subs.exclude(user__profile__digest_prefs=Profile.ALL_MESSAGES)
+    recipient_list = list(email_subs.values_list("user__email", flat=True))
+
     # No email subscriptions
-    if not email_subs:
+    if not recipient_list:
         return
 
-    recipient_list = [sub.user.email for sub in email_subs]
     from_email = settings.DEFAULT_NOREPLY_EMAIL
 
     send_email(template_name=email_template,
@@ -460,6 +460,7 @@ def get_post_list(target, request, show=None):
     posts = posts.filter(type=type_filter) if type_filter is not None else posts
 
     posts = posts.select_related("root").select_related("author__profile", "lastedit_user__profile")
+    posts = posts.defer(*const.LIST_DEFERRED)
     posts = posts.order_by("-rank")
 
     # Cache the users posts add pagination to posts.
@@ -629,19 +630,6 @@ def show_nonzero(value):
     return value if value else ''
 
 
-@register.simple_tag
-def object_count(request, otype):
-    user = request.user
-    count = 0
-
-    if user.is_authenticated:
-
-        if otype == "message":
-            count = user.profile.new_messages
-
-    return count
-
-
 def pluralize(value, word):
     if value > 1:
         return "%d %ss" % (value, word)
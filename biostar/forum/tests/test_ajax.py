@@ -54,6 +54,35 @@ class PostTest(TestCase):
         self.preform_votes(post=self.post, user=self.owner)
         self.preform_votes(post=self.post, user=user2)
 
+    def test_vote_toggle(self):
+        """Test a second vote of the same type removes the first one"""
+        user2 = User.objects.create(username="user", email="user@tested.com", password="tested")
+
+        msg, vote, change = auth.apply_vote(post=self.post, user=user2, vote_type=models.Vote.UP)
+        self.assertEqual(change, 1)
+        self.assertEqual(models.Post.objects.get(pk=self.post.pk).vote_count, 1)
+
+        msg, vote, change = auth.apply_vote(post=self.post, user=user2, vote_type=models.Vote.UP)
+        self.assertEqual(change, -1)
+        self.assertEqual(msg, "Upvote removed")
+        self.assertFalse(models.Vote.objects.filter(post=self.post, author=user2).exists())
+        self.assertEqual(models.Post.objects.get(pk=self.post.pk).vote_count, 0)
+
+    def test_vote_root(self):
+        """Test votes on a root post update the post and thread counts"""
+        user2 = User.objects.create(username="user", email="user@tested.com", password="tested")
+
+        auth.apply_vote(post=self.post, user=user2, vote_type=models.Vote.BOOKMARK)
+        auth.apply_vote(post=self.post, user=user2, vote_type=models.Vote.UP)
+
+        post = models.Post.objects.get(pk=self.post.pk)
+        self.assertEqual((post.vote_count, post.thread_votecount, post.book_count), (2, 2, 1))
+
+        auth.apply_vote(post=post, user=user2, vote_type=models.Vote.ACCEPT)
+
+        post = models.Post.objects.get(pk=self.post.pk)
+        self.assertEqual((post.vote_count, post.thread_votecount, post.accept_count), (3, 3, 1))
+
     def test_drag_and_drop(self):
         """
         Test AJAX function used to drag and drop.
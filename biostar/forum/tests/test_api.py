@@ -1,8 +1,10 @@
 import logging
+import json
 import os
 import shutil
 import datetime
 from django.core import management
+from django.core.files.uploadedfile import SimpleUploadedFile
 from django.urls import reverse
 from django.test import TestCase, override_settings
 from django.conf import settings
@@ -59,4 +61,20 @@ class PostAPITest(TestCase):
         self.assertEqual(response.status_code, 200)
         #self.process_response(response=response)
 
+    def test_tags_list(self):
+        """Test tag counts for an uploaded file of tags"""
+        post = models.Post.objects.create(title="Test tags", author=self.owner, content="Test tags",
+                                          type=models.Post.QUESTION, tag_val="foo,bar")
+        models.Post.objects.create(title="Test", author=self.owner, content="Test answer",
+                                   type=models.Post.ANSWER, parent=post)
 
+        tags = SimpleUploadedFile("tags.txt", b"foo\nBar\n\nbaz\n")
+        url = reverse("api_tags_list")
+        request = fake_request(url=url, data=dict(tags=tags), user=self.owner)
+
+        response = api.tags_list(request=request)
+        data = json.loads(response.content)
+
+        self.assertEqual(data["foo"], dict(total=1, answer_count=1, comment_count=0))
+        self.assertEqual(data["bar"], dict(total=1, answer_count=1, comment_count=0))
+        self.assertEqual(data["baz"], dict(total=0, answer_count=0, comment_count=0))
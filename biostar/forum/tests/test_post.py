@@ -1,11 +1,12 @@
 import logging
 import os
 import shutil
+from unittest.mock import patch
 from django.core import management
 from django.urls import reverse
 from django.test import TestCase, override_settings
 from django.conf import settings
-from biostar.forum import models, views, search, tasks, feed
+from biostar.forum import models, views, search, tasks, feed, markdown
 from biostar.utils.helpers import fake_request
 from biostar.accounts.models import User
 
@@ -81,6 +82,53 @@ class PostTest(TestCase):
 
         self.assertTrue(response.status_code == 200, 'Error rendering comments')
 
+    def test_post_counts(self):
+        """
+        Test answer, comment and reply counts are updated on the thread.
+        """
+        answer = models.Post.objects.create(title="Test", author=self.owner, content="Test answer",
+                                            type=models.Post.ANSWER, root=self.post, parent=self.post)
+        models.Post.objects.create(title="Test", author=self.owner, content="Test comment",
+                                   type=models.Post.COMMENT, root=self.post, parent=answer)
+
+        root = models.Post.objects.get(pk=self.post.pk)
+        answer = models.Post.objects.get(pk=answer.pk)
+
+        self.assertEqual((root.answer_count, root.comment_count, root.reply_count), (1, 1, 2),
+                         "Error computing thread counts")
+        self.assertEqual((answer.comment_count, answer.reply_count), (1, 1), "Error computing parent counts")
+
+    def test_post_html(self):
+        """
+        Test the html is rendered again only when the content changes.
+        """
+        post = models.Post.objects.get(pk=self.post.pk)
+
+        with patch('biostar.forum.markdown.parse', side_effect=markdown.parse) as parse:
+            post.save()
+            self.assertEqual(parse.call_count, 0, "Html rendered without a content change.")
+
+            post.content = "Test **edited**"
+            post.save()
+            self.assertEqual(parse.call_count, 1, "Html not rendered after edit.")
+
+        post = models.Post.objects.get(pk=self.post.pk)
+        self.assertIn("<strong>edited</strong>", post.html, "Html not rendered after edit.")
+
+    def test_post_tags(self):
+        """
+        Test tags follow the tag value of a post when it is edited.
+        """
+        post = models.Post.objects.create(title="Test tags", author=self.owner, content="Test tags",
+                                          type=models.Post.QUESTION, tag_val="foo,bar")
+
+        self.assertEqual(set(post.tags.names()), {"foo", "bar"}, "Tags not set on create.")
+
+        post.tag_val = "bar,baz"
+        post.save()
+
+        self.assertEqual(set(post.tags.names()), {"bar", "baz"}, "Tags not updated on edit.")
+
     def Xtest_edit_post(self):
         """
         Test post edit for root and descendants
@@ -2,7 +2,7 @@ import re
 import bleach
 import logging
 import time
-import uuid
+import secrets
 from functools import wraps
 from itertools import islice, count
 from datetime import datetime
@@ -28,7 +28,7 @@ def split(text):
 
 
 def get_uuid(limit=32):
-    return str(uuid.uuid4())[:limit]
+    return secrets.token_hex((limit + 1) // 2)[:limit]
 
 
 def strip_tags(text):
@@ -132,6 +132,9 @@ def apply_sort(posts, limit=None, order=None):
     # Select related information used during rendering.
     posts = posts.select_related("root").select_related("author__profile", "lastedit_user__profile")
 
+    # The wide text columns are not shown in post lists.
+    posts = posts.defer(*LIST_DEFERRED)
+
     return posts
 
 
@@ -426,6 +429,8 @@ def myvotes(request):
 
     votes = Vote.objects.filter(post__author=request.user).select_related('post', 'post__root',
                                                                           'author__profile').order_by("-date")
+    # Only the title and type of the voted post are shown.
+    votes = votes.defer(*VOTE_LIST_DEFERRED)
     # Create the paginator
     paginator = CachedPaginator(object_list=votes,
                                 per_page=settings.POSTS_PER_PAGE)
@@ -541,7 +546,7 @@ def post_view(request, uid):
     "Return a detailed view for specific post"
 
     # Get the post.
-    post = Post.objects.filter(uid=uid).select_related('root').first()
+    post = Post.tree_posts.filter(uid=uid).first()
     user = request.user
     if not post:
         messages.error(request, "Post does not exist.")
@@ -4,7 +4,7 @@ import os, logging, datetime
 from urllib import request
 import feedparser
 from django.utils.timezone import utc
-import uuid
+import secrets
 
 logger = logging.getLogger("engine")
 
@@ -21,7 +21,7 @@ def abspath(*args):
 
 
 def get_uuid(limit=32):
-    return str(uuid.uuid4())[:limit]
+    return secrets.token_hex((limit + 1) // 2)[:limit]
 
 
 class Blog(models.Model):
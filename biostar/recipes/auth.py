@@ -1,6 +1,6 @@
-import difflib
 import logging
-import uuid, copy, base64
+import secrets
+import copy, base64
 import json
 import base64
 import io
@@ -33,7 +33,7 @@ JOB_COLORS = {Job.SPOOLED: "spooled",
 
 
 def get_uuid(limit=32):
-    return str(uuid.uuid4())[:limit]
+    return secrets.token_hex((limit + 1) // 2)[:limit]
 
 
 def generate_uuid(prefix, suffix):
@@ -4,7 +4,7 @@ import mimetypes
 import os
 import quopri
 import tarfile
-import uuid
+import secrets
 import bleach
 import shlex
 import random
@@ -19,7 +19,7 @@ CHUNK = 1024 * 1024
 
 
 def get_uuid(limit=32):
-    return str(uuid.uuid4())[:limit]
+    return secrets.token_hex((limit + 1) // 2)[:limit]
 
 
 def join(*args):
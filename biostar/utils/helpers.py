@@ -6,13 +6,13 @@ import html2markdown
 from datetime import datetime
 from biostar import VERSION
 import os
-import uuid
+import secrets
 
 logger = logging.getLogger('engine')
 
 
 def get_uuid(limit=32):
-    return str(uuid.uuid4())[:limit]
+    return secrets.token_hex((limit + 1) // 2)[:limit]
 
 
 def fake_request(url, data, user, method="POST", rmeta={}):